@@ -2,7 +2,7 @@ import os
 import sys
 import argparse
 
-from steam_analyzer import SteamDataAnalyzer
+from steam_analyzer import SteamDataAnalyzer, tokenize
 from chart_generator import ChartGenerator
 
 FULL_DATA_PATH = 'data/dataset/steam_games.csv'
@@ -24,6 +24,11 @@ Opções:
                         ou 'full' para usar o dataset completo.
                         Se esta opção não for especificada ou for vazia/inválida,
                         a análise será executada para o dataset COMPLETO por padrão.
+  -k PALAVRAS, --keywords PALAVRAS
+                        Restringe as análises aos jogos cujo nome ou descrição
+                        ("About the game") contêm TODAS as palavras informadas
+                        (separadas por vírgula ou espaço). Usa um índice
+                        invertido, salvo em cache ao lado do dataset ('.idx').
   -h, --help, --h, -help
                         Mostra esta mensagem de ajuda e sai.
 
@@ -34,6 +39,9 @@ Exemplos de uso:
   - Analisar o dataset completo:
     python main_analysis.py --sample full
 
+  - Analisar apenas jogos 'roguelike' da amostra 'sample_05':
+    python main_analysis.py -s 5 -k roguelike
+
   - Analisar o dataset completo (comportamento padrão, sem opções):
     python main_analysis.py
 """
@@ -43,7 +51,7 @@ def print_custom_help():
     print(CUSTOM_HELP_MESSAGE)
     sys.exit(0)
 
-def run_analysis(file_path, data_type_label, filename_prefix):
+def run_analysis(file_path, data_type_label, filename_prefix, keywords=None):
     """
     Executa a análise completa dos dados de jogos Steam, imprime os resultados
     e gera os gráficos correspondentes.
@@ -54,6 +62,8 @@ def run_analysis(file_path, data_type_label, filename_prefix):
                                 (e.g., "Dataset Completo", "Amostra (Sample 01)").
         filename_prefix (str): Prefixo para o nome dos arquivos de gráficos salvos
                                (e.g., "full", "sample_01").
+        keywords (list[str], opcional): Palavras-chave que restringem as análises
+                                        aos jogos cujo nome ou descrição as contêm.
     """
     if not os.path.exists(file_path):
         print(f"Erro: O arquivo de dados '{file_path}' não foi encontrado.")
@@ -62,15 +72,24 @@ def run_analysis(file_path, data_type_label, filename_prefix):
 
     try:
         print(f"Carregando dados de: {file_path}...")
-        analyzer = SteamDataAnalyzer(file_path)
+        analyzer = SteamDataAnalyzer(file_path, build_text_index=bool(keywords), use_index_cache=bool(keywords))
         
         print(f"Dados carregados com sucesso! Total de jogos: {len(analyzer.data)}\n")
         
+        row_ids = None
+        if keywords:
+            row_ids = analyzer.find_row_ids(keywords)
+            print(f"Filtro por palavras-chave {keywords}: {len(row_ids)} jogos correspondentes.\n")
+            
+            if not row_ids:
+                print("Nenhum jogo corresponde ao filtro por palavras-chave. As análises não serão executadas.")
+                return
+        
         print("---------------------------------------------")
         print("--- Percentual de Jogos Gratuitos e Pagos ---")
         print("---------------------------------------------")
         
-        percentages = analyzer.get_free_vs_paid_percentage()
+        percentages = analyzer.get_free_vs_paid_percentage(row_ids=row_ids)
         
         print(f"Jogos Gratuitos: {percentages['gratuito_percentual']:.2f}%")
         print(f"Jogos Pagos: {percentages['pago_percentual']:.2f}%")
@@ -93,14 +112,14 @@ def run_analysis(file_path, data_type_label, filename_prefix):
         print("--- Ano com Maior Número de Novos Jogos ---")
         print("-------------------------------------------")
         
-        most_games_year = analyzer.get_year_with_most_new_games()
+        most_games_year = analyzer.get_year_with_most_new_games(row_ids=row_ids)
         
         if most_games_year['years']:
             print(f"O ano(s) com o maior número de jogos lançados é/são: {most_games_year['years']} com {most_games_year['max_games']} jogos.")
         else:
             print("Não foi possível determinar o ano com maior número de jogos (dados insuficientes ou inválidos).")
         
-        all_year_counts = analyzer.get_all_release_year_counts()
+        all_year_counts = analyzer.get_all_release_year_counts(row_ids=row_ids)
         
         chart_generator.generate_q2_bar_chart(
             all_year_counts,
@@ -124,7 +143,7 @@ def run_analysis(file_path, data_type_label, filename_prefix):
         print("--- Top 10 Gêneros por Média de Recomendações (Autoral) ---")
         print("-----------------------------------------------------------")
         
-        top_genres_data_for_display = analyzer.get_top_genre_by_avg_recommendations(min_year=2015, min_positive_reviews=1000, top_n=10)
+        top_genres_data_for_display = analyzer.get_top_genre_by_avg_recommendations(min_year=2015, min_positive_reviews=1000, top_n=10, row_ids=row_ids)
         
         if top_genres_data_for_display:
             
@@ -196,6 +215,14 @@ if __name__ == "__main__":
         default='full',
         help="ID do dataset a ser analisado (1-10 para samples, 'full' para o dataset completo)."
     )
+    
+    parser.add_argument(
+        '-k', '--keywords',
+        dest='keywords',
+        type=str,
+        default='',
+        help="Palavras-chave (separadas por vírgula ou espaço) para filtrar os jogos por nome ou descrição."
+    )
 
     args = parser.parse_args()
 
@@ -222,5 +249,14 @@ if __name__ == "__main__":
         else:
             print(f"Aviso: Parâmetro '{selected_id}' inválido para a opção -s/--sample. Analisando o dataset COMPLETO por padrão.")
 
+    keywords = list(dict.fromkeys(tokenize(args.keywords)))
+    
+    if args.keywords.strip() and not keywords:
+        print(f"Aviso: Parâmetro '{args.keywords}' não contém palavras válidas para a opção -k/--keywords. Analisando SEM filtro por palavras-chave.")
+    
+    if keywords:
+        data_label = f"{data_label} - Filtro: {', '.join(keywords)}"
+        file_prefix = f"{file_prefix}_kw_{'_'.join(keywords)}"
+
     print(f"\n--- Executando Análise para: {data_label} ---")
-    run_analysis(file_to_analyze, data_label, file_prefix)
\ No newline at end of file
+    run_analysis(file_to_analyze, data_label, file_prefix, keywords)
\ No newline at end of file
@@ -1,13 +1,45 @@
 import csv
+import os
+import re
+import sys
+import json
+from array import array
 from datetime import datetime
 import collections
 
+TEXT_INDEX_FIELDS = ['name', 'about_the_game']
+TEXT_INDEX_CACHE_SUFFIX = '.idx'
+TEXT_INDEX_CACHE_VERSION = 2
+TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+
+def tokenize(text):
+    """
+    Quebra um texto em tokens minúsculos (sequências alfanuméricas).
+    """
+    if not isinstance(text, str) or not text:
+        return []
+    return TOKEN_PATTERN.findall(text.lower())
+
+
 class SteamDataAnalyzer:
     
-    def __init__(self, filepath):
+    def __init__(self, filepath, build_text_index=False, use_index_cache=False):
+        """
+        Args:
+            filepath (str): Caminho para o arquivo CSV a ser analisado.
+            build_text_index (bool): Se True, constrói o índice invertido sobre
+                                     'name' e 'about_the_game' no carregamento.
+            use_index_cache (bool): Se True, lê/grava o índice em um arquivo
+                                    '<filepath>.idx' ao lado do dataset.
+        """
         self.filepath = filepath
         self.data = []
+        self.use_index_cache = use_index_cache
+        self.text_index = None
         self._load_data()
+        if build_text_index:
+            self._load_text_index()
 
     
     def _load_data(self):
@@ -65,14 +97,217 @@ class SteamDataAnalyzer:
             raise Exception(f"Erro ao carregar ou processar os dados do CSV: {e}")
 
     
-    def get_free_vs_paid_percentage(self):
+    @property
+    def index_cache_path(self):
+        """
+        Caminho do arquivo de cache do índice invertido, ao lado do dataset.
+        """
+        return self.filepath + TEXT_INDEX_CACHE_SUFFIX
+
+
+    def _source_signature(self):
+        """
+        Retorna (tamanho, mtime) do CSV, usado para invalidar o cache do índice.
+        """
+        stat = os.stat(self.filepath)
+        return (stat.st_size, stat.st_mtime_ns)
+
+
+    def _build_text_index(self):
+        """
+        Constrói o índice invertido sobre os campos de TEXT_INDEX_FIELDS.
+        Cada token aponta para um array('i') ordenado com os IDs (posições em
+        self.data) das linhas que o contêm.
+        """
+        postings = collections.defaultdict(list)
+        for row_id, game in enumerate(self.data):
+            tokens = set()
+            for field in TEXT_INDEX_FIELDS:
+                tokens.update(tokenize(game.get(field)))
+            for token in tokens:
+                postings[token].append(row_id)
+        
+        return {token: array('i', row_ids) for token, row_ids in postings.items()}
+
+
+    def _index_cache_header(self):
+        """
+        Metadados que identificam o CSV e o formato binário do cache do índice.
+        """
+        return {
+            'version': TEXT_INDEX_CACHE_VERSION,
+            'source': list(self._source_signature()),
+            'row_count': len(self.data),
+            'itemsize': array('i').itemsize,
+            'byteorder': sys.byteorder
+        }
+
+
+    def _read_index_cache(self):
+        """
+        Lê o índice do cache, se existir e corresponder ao CSV atual.
+        O arquivo tem uma linha de cabeçalho JSON (metadados, tokens e tamanho
+        de cada lista de postings) seguida dos IDs em binário (array('i')).
+        Retorna None se o cache estiver ausente, desatualizado ou inválido.
+        """
+        try:
+            with open(self.index_cache_path, 'rb') as f:
+                header = json.loads(f.readline().decode('utf-8'))
+                
+                if not isinstance(header, dict):
+                    return None
+                tokens = header.pop('tokens', None)
+                counts = header.pop('counts', None)
+                if header != self._index_cache_header():
+                    return None
+                if (not isinstance(tokens, list) or not isinstance(counts, list) or
+                    len(tokens) != len(counts) or
+                    not all(isinstance(token, str) for token in tokens) or
+                    not all(isinstance(count, int) and count > 0 for count in counts)):
+                    return None
+                
+                row_ids = array('i')
+                row_ids.fromfile(f, sum(counts))
+                if f.read(1):
+                    return None
+        except Exception:
+            return None
+        
+        if row_ids and (min(row_ids) < 0 or max(row_ids) >= len(self.data)):
+            return None
+        
+        postings = {}
+        offset = 0
+        for token, count in zip(tokens, counts):
+            postings[token] = row_ids[offset:offset + count]
+            offset += count
+        
+        return postings
+
+
+    def _write_index_cache(self, postings):
+        """
+        Grava o índice no arquivo de cache. Falhas de escrita não são fatais.
+        """
+        header = self._index_cache_header()
+        header['tokens'] = list(postings)
+        header['counts'] = [len(row_ids) for row_ids in postings.values()]
+        try:
+            with open(self.index_cache_path, 'wb') as f:
+                f.write(json.dumps(header, ensure_ascii=True).encode('utf-8') + b'\n')
+                for row_ids in postings.values():
+                    row_ids.tofile(f)
+        except OSError as e:
+            print(f"Aviso: não foi possível gravar o cache do índice em '{self.index_cache_path}': {e}")
+
+
+    def _load_text_index(self):
+        """
+        Carrega o índice invertido do cache (se habilitado) ou o constrói.
+        """
+        if self.text_index is not None:
+            return self.text_index
+        
+        if self.use_index_cache:
+            self.text_index = self._read_index_cache()
+            if self.text_index is not None:
+                print(f"Índice de texto carregado do cache '{self.index_cache_path}'. Total de tokens: {len(self.text_index)}")
+                return self.text_index
+        
+        self.text_index = self._build_text_index()
+        print(f"Índice de texto construído. Total de tokens: {len(self.text_index)}")
+        
+        if self.use_index_cache:
+            self._write_index_cache(self.text_index)
+        
+        return self.text_index
+
+
+    @staticmethod
+    def _intersect_postings(left, right):
+        """
+        Interseção de duas listas de postings ordenadas.
+        """
+        result = array('i')
+        i = j = 0
+        len_left, len_right = len(left), len(right)
+        while i < len_left and j < len_right:
+            a, b = left[i], right[j]
+            if a == b:
+                result.append(a)
+                i += 1
+                j += 1
+            elif a < b:
+                i += 1
+            else:
+                j += 1
+        return result
+
+
+    @staticmethod
+    def _keyword_tokens(keywords):
+        """
+        Normaliza palavras-chave (string ou lista de strings) em um conjunto de tokens.
+        """
+        if not keywords:
+            return set()
+        if isinstance(keywords, str):
+            keywords = [keywords]
+        
+        tokens = set()
+        for keyword in keywords:
+            tokens.update(tokenize(keyword))
+        return tokens
+
+
+    def find_row_ids(self, keywords):
+        """
+        Retorna os IDs das linhas cujo nome ou descrição contêm TODAS as
+        palavras-chave, resolvidos por interseção das listas de postings.
+        'keywords' pode ser uma string ou uma lista de strings. Palavras-chave
+        sem nenhum token (e.g., '', [''] ou '!!!') não filtram: todos os IDs
+        são retornados, como em uma consulta sem 'keywords'.
+        """
+        tokens = self._keyword_tokens(keywords)
+        
+        if not tokens:
+            return array('i', range(len(self.data)))
+        
+        index = self._load_text_index()
+        postings = [index.get(token) for token in tokens]
+        if any(posting is None for posting in postings):
+            return array('i')
+        
+        postings.sort(key=len)
+        result = array('i', postings[0])
+        for posting in postings[1:]:
+            if not result:
+                break
+            result = self._intersect_postings(result, posting)
+        
+        return result
+
+
+    def _iter_games(self, keywords=None, row_ids=None):
+        """
+        Itera sobre os jogos, opcionalmente restritos às palavras-chave ou a IDs
+        de linha já resolvidos por find_row_ids (que têm precedência).
+        """
+        if row_ids is None:
+            if not self._keyword_tokens(keywords):
+                return iter(self.data)
+            row_ids = self.find_row_ids(keywords)
+        return (self.data[row_id] for row_id in row_ids)
+
+    
+    def get_free_vs_paid_percentage(self, keywords=None, row_ids=None):
         """
         Calcula a porcentagem de jogos gratuitos vs. pagos.
         """
         free_games = 0
         paid_games = 0
         
-        for game in self.data:
+        for game in self._iter_games(keywords, row_ids):
             price = game.get('price')
             if price is not None:
                 if price == 0.0:
@@ -93,12 +328,12 @@ class SteamDataAnalyzer:
         }
 
     
-    def get_year_with_most_new_games(self):
+    def get_year_with_most_new_games(self, keywords=None, row_ids=None):
         """
         Identifica o(s) ano(s) com o maior número de lançamentos de jogos.
         """
         year_counts = {}
-        for game in self.data:
+        for game in self._iter_games(keywords, row_ids):
             release_year = game.get('release_date')
             if release_year is not None:
                 year_counts[release_year] = year_counts.get(release_year, 0) + 1
@@ -124,7 +359,7 @@ class SteamDataAnalyzer:
         }
 
     
-    def get_top_genre_by_avg_recommendations(self, min_year=2015, min_positive_reviews=1000, top_n=10):
+    def get_top_genre_by_avg_recommendations(self, min_year=2015, min_positive_reviews=1000, top_n=10, keywords=None, row_ids=None):
         """
         Encontra os top N gêneros com a maior média de recomendações positivas,
         filtrando por ano de lançamento e mínimo de reviews.
@@ -133,7 +368,7 @@ class SteamDataAnalyzer:
         genre_recommendations_sum = collections.defaultdict(float)
         genre_game_count = collections.defaultdict(int)
 
-        for game in self.data:
+        for game in self._iter_games(keywords, row_ids):
             release_year = game.get('release_date')
             genres = game.get('genres')
             recommendations_value = game.get('recommendations') 
@@ -170,13 +405,13 @@ class SteamDataAnalyzer:
         return final_sorted_genres_for_display
         
     
-    def get_all_release_year_counts(self):
+    def get_all_release_year_counts(self, keywords=None, row_ids=None):
         """
         Retorna um dicionário com a contagem de jogos lançados por ano.
         A data de lançamento já é pré-processada como ano inteiro no _load_data.
         """
         year_counts = collections.defaultdict(int)
-        for game in self.data:
+        for game in self._iter_games(keywords, row_ids):
             release_year = game.get('release_date')
             if release_year is not None:
                 year_counts[release_year] += 1
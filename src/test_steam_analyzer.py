@@ -1,7 +1,14 @@
 import unittest
 import os
+import io
+import csv
 import json
-from steam_analyzer import SteamDataAnalyzer
+import shutil
+import tempfile
+import importlib.util
+from contextlib import redirect_stdout
+from unittest import mock
+from steam_analyzer import SteamDataAnalyzer, tokenize
 
 SAMPLES_DIR = 'data/samples'
 ALL_EXPECTED_RESULTS_FILE = os.path.join(SAMPLES_DIR, 'all_expected_results.json')
@@ -125,5 +132,155 @@ class TestSteamDataAnalyzer(unittest.TestCase):
                 self.assertAlmostEqual(result['average_recommendations'], expected_q3['average_recommendations'], places=2,
                                      msg=f"Falha na Q3 para amostra {sample_id} - Média de recomendações")
 
+    def test_keyword_filter_matches_linear_scan(self):
+        """
+        Testa se o filtro por palavras-chave (via índice invertido) seleciona os mesmos
+        jogos que uma varredura linear de 'name' e 'about_the_game'.
+        """
+        for sample_id, csv_path, _ in self.samples_config:
+            with self.subTest(sample=sample_id):
+                analyzer = SteamDataAnalyzer(csv_path, build_text_index=True)
+                
+                for keywords in (['game'], ['world'], ['game', 'world'], ['Play'], ['palavrainexistente']):
+                    tokens = set(token for keyword in keywords for token in tokenize(keyword))
+                    expected_ids = [
+                        row_id for row_id, game in enumerate(analyzer.data)
+                        if tokens <= set(tokenize(game.get('name')) + tokenize(game.get('about_the_game')))
+                    ]
+                    self.assertListEqual(list(analyzer.find_row_ids(keywords)), expected_ids,
+                                         msg=f"Falha no filtro {keywords} para amostra {sample_id}")
+
+    def test_keyword_filter_intersection_narrows_results(self):
+        """
+        Testa se a interseção de duas palavras-chave remove linhas de ambas as listas.
+        Na amostra 01, 'game' e 'world' ocorrem juntas em apenas parte dos jogos.
+        """
+        csv_path = os.path.join(SAMPLES_DIR, 'steam_games_sample_01.csv')
+        analyzer = SteamDataAnalyzer(csv_path, build_text_index=True)
+        
+        game_ids = set(analyzer.find_row_ids('game'))
+        world_ids = set(analyzer.find_row_ids('world'))
+        both_ids = list(analyzer.find_row_ids(['game', 'world']))
+        
+        self.assertTrue(both_ids)
+        self.assertLess(len(both_ids), len(game_ids))
+        self.assertLess(len(both_ids), len(world_ids))
+        self.assertListEqual(both_ids, sorted(game_ids & world_ids))
+
+    def test_keyword_filter_restricts_queries(self):
+        """
+        Testa se os métodos de consulta agregam apenas os jogos filtrados.
+        """
+        _, csv_path, _ = self.samples_config[0]
+        analyzer = SteamDataAnalyzer(csv_path)
+        
+        unfiltered = analyzer.get_free_vs_paid_percentage()
+        for empty_keywords in (None, '', [], [''], ['', '!!!'], '!!!'):
+            self.assertEqual(analyzer.get_free_vs_paid_percentage(keywords=empty_keywords), unfiltered,
+                             msg=f"Filtro vazio {empty_keywords!r} deveria equivaler a nenhum filtro")
+            self.assertEqual(len(analyzer.find_row_ids(empty_keywords)), len(analyzer.data))
+        
+        self.assertEqual(analyzer.get_all_release_year_counts(keywords='palavrainexistente'), {})
+        
+        first_game = analyzer.data[0]
+        keyword = tokenize(first_game['name'])[0]
+        row_ids = analyzer.find_row_ids(keyword)
+        matched_games = [analyzer.data[row_id] for row_id in row_ids]
+        self.assertIn(first_game, matched_games)
+        
+        year_counts = analyzer.get_all_release_year_counts(keywords=keyword)
+        self.assertEqual(sum(year_counts.values()),
+                         sum(1 for game in matched_games if game.get('release_date') is not None))
+        self.assertEqual(analyzer.get_all_release_year_counts(row_ids=row_ids), year_counts)
+
+    def test_find_row_ids_returns_independent_array(self):
+        """
+        Testa se alterar o resultado de find_row_ids não altera consultas seguintes.
+        """
+        _, csv_path, _ = self.samples_config[0]
+        analyzer = SteamDataAnalyzer(csv_path, build_text_index=True)
+        
+        row_ids = analyzer.find_row_ids('game')
+        expected_ids = list(row_ids)
+        row_ids.append(len(analyzer.data))
+        
+        self.assertListEqual(list(analyzer.find_row_ids('game')), expected_ids)
+
+    def test_text_index_cache_round_trip(self):
+        """
+        Testa se o índice gravado em cache ao lado do dataset é reutilizado, e
+        descartado quando o CSV muda ou o arquivo de cache está corrompido.
+        """
+        def load(path):
+            output = io.StringIO()
+            with redirect_stdout(output):
+                analyzer = SteamDataAnalyzer(path, build_text_index=True, use_index_cache=True)
+            return analyzer, output.getvalue()
+        
+        _, csv_path, _ = self.samples_config[0]
+        temp_dir = tempfile.mkdtemp()
+        try:
+            temp_csv = os.path.join(temp_dir, os.path.basename(csv_path))
+            shutil.copy(csv_path, temp_csv)
+            
+            built, output = load(temp_csv)
+            self.assertIn("Índice de texto construído", output)
+            self.assertTrue(os.path.exists(built.index_cache_path))
+            
+            cached, output = load(temp_csv)
+            self.assertIn("carregado do cache", output)
+            self.assertListEqual(list(cached.find_row_ids(['game', 'world'])),
+                                 list(built.find_row_ids(['game', 'world'])))
+            
+            with open(temp_csv, 'r', newline='', encoding='utf-8') as f:
+                new_row = list(csv.reader(f))[1]
+            new_row[0], new_row[1] = '999999', 'Zzyzx Quest'
+            with open(temp_csv, 'a', newline='', encoding='utf-8') as f:
+                csv.writer(f, quoting=csv.QUOTE_ALL).writerow(new_row)
+            
+            changed, output = load(temp_csv)
+            self.assertNotIn("carregado do cache", output)
+            self.assertListEqual(list(changed.find_row_ids('zzyzx')), [len(changed.data) - 1])
+            
+            with open(changed.index_cache_path, 'wb') as f:
+                f.write(b'\x80\x04corrompido')
+            
+            corrupted, output = load(temp_csv)
+            self.assertNotIn("carregado do cache", output)
+            self.assertListEqual(list(corrupted.find_row_ids('zzyzx')), [len(corrupted.data) - 1])
+            
+            _, output = load(temp_csv)
+            self.assertIn("carregado do cache", output)
+        finally:
+            shutil.rmtree(temp_dir)
+
+    @unittest.skipUnless(importlib.util.find_spec('matplotlib'), "matplotlib não instalado")
+    def test_run_analysis_keyword_filter(self):
+        """
+        Testa se run_analysis resolve o filtro uma única vez e encerra sem gerar
+        gráficos quando nenhum jogo corresponde às palavras-chave.
+        """
+        import main_analysis
+        
+        _, csv_path, _ = self.samples_config[0]
+        
+        with mock.patch.object(main_analysis, 'chart_generator') as charts, \
+             mock.patch.object(SteamDataAnalyzer, 'find_row_ids', autospec=True,
+                               side_effect=SteamDataAnalyzer.find_row_ids) as find_row_ids:
+            output = io.StringIO()
+            with redirect_stdout(output):
+                main_analysis.run_analysis(csv_path, 'Teste', 'teste', ['zzzqqq'])
+            
+            self.assertIn("Nenhum jogo corresponde ao filtro", output.getvalue())
+            self.assertNotIn("erro inesperado", output.getvalue())
+            self.assertEqual(charts.method_calls, [])
+            
+            find_row_ids.reset_mock()
+            with redirect_stdout(io.StringIO()):
+                main_analysis.run_analysis(csv_path, 'Teste', 'teste', ['game', 'world'])
+            
+            self.assertEqual(find_row_ids.call_count, 1)
+            charts.generate_q1_pie_chart.assert_called_once()
+
 if __name__ == '__main__':
     unittest.main(argv=['first-arg-is-ignored'], exit=False)